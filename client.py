@@ -13,17 +13,90 @@ Usage: python3 client.py <IP_SERVEUR> [PORT]
 ============================================================================
 """
 
+import os
+import re
+import select
 import socket
 import sys
 import signal
+import threading
 import time
-import json
+from collections import deque
 from typing import Optional
 
+# Parseur JSON : orjson > simdjson > ujson > stdlib (les trois premiers
+# sont des extensions C, 3-5x plus rapides, et acceptent les bytes
+# directement ; simdjson vectorise en plus le parsing, utile quand le
+# leaderboard grossit). L'import est différé au premier message reçu :
+# le démarrage (bannière, erreur d'usage) ne paie pas ces quelques
+# millisecondes d'import.
+
+def _init_json_parser() -> None:
+    """Choisit le meilleur parseur disponible et lie _loads/_dumps"""
+    global _loads, _dumps
+
+    try:
+        import orjson
+        _loads = orjson.loads
+        _dumps = orjson.dumps
+        return
+    except ImportError:
+        pass
+
+    try:
+        import simdjson
+        # Le Parser réutilise son arène interne d'un parse à l'autre ;
+        # recursive=True matérialise des dict/list Python ordinaires,
+        # donc réutiliser le parseur ne pose pas de problème d'aliasing
+        parser = simdjson.Parser()
+
+        def _loads(data, _parse=parser.parse):
+            return _parse(data, True)
+
+        try:
+            _dumps = simdjson.dumps
+        except AttributeError:
+            from json import dumps as _dumps
+        return
+    except ImportError:
+        pass
+
+    try:
+        import ujson
+        _loads = ujson.loads
+        _dumps = ujson.dumps
+        return
+    except ImportError:
+        pass
+
+    import json
+    # json.loads reconstruit un décodeur à chaque appel ; on en garde un
+    # seul, lié une fois pour toutes (il ne prend que des str,
+    # contrairement aux parseurs C qui acceptent les bytes)
+    decoder = json.JSONDecoder()
+
+    def _loads(data, _decode=decoder.decode):
+        if isinstance(data, (bytes, bytearray)):
+            data = data.decode('utf-8')
+        return _decode(data)
+
+    _dumps = json.dumps
+
+def _loads(data):
+    """Premier appel : résout le parseur, qui remplace cette fonction"""
+    _init_json_parser()
+    return _loads(data)
+
+def _dumps(obj):
+    """Premier appel : résout le parseur, qui remplace cette fonction"""
+    _init_json_parser()
+    return _dumps(obj)
+
 # Configuration
 DEFAULT_PORT = 8080
-BUFFER_SIZE = 8192
+BUFFER_SIZE = 65536  # multiple de page : absorbe une rafale de messages par recv
 CONNECTION_TIMEOUT = 30
+RECEIVE_TIMEOUT = 2.0
 
 # ============================================================================
 # COULEURS ANSI ULTRA-MODERNES
@@ -46,6 +119,18 @@ class C:
     BOLD = '\033[1m'
     DIM = '\033[2m'
 
+    # Combinaisons gras+couleur en une seule séquence SGR : moitié moins
+    # d'octets envoyés au terminal que '\033[38;5;141m' + '\033[1m'
+    PURPLE_BOLD = '\033[1;38;5;141m'
+    GREEN_BOLD = '\033[1;38;5;156m'
+    YELLOW_BOLD = '\033[1;38;5;221m'
+    RED_BOLD = '\033[1;38;5;204m'
+    CYAN_BOLD = '\033[1;38;5;117m'
+    BLUE_BOLD = '\033[1;38;5;75m'
+    PINK_BOLD = '\033[1;38;5;213m'
+    ORANGE_BOLD = '\033[1;38;5;214m'
+    GRAY_BOLD = '\033[1;38;5;246m'
+
     # Symboles Unicode modernes
     CHECK = '✓'
     CROSS = '✗'
@@ -58,19 +143,101 @@ class C:
     GAME = '🎮'
     PARTY = '🎉'
 
+# Couleur -> variante grasse, pour box()/table() qui reçoivent la couleur
+# en paramètre
+_BOLD_OF = {
+    C.PURPLE: C.PURPLE_BOLD,
+    C.GREEN: C.GREEN_BOLD,
+    C.YELLOW: C.YELLOW_BOLD,
+    C.RED: C.RED_BOLD,
+    C.CYAN: C.CYAN_BOLD,
+    C.BLUE: C.BLUE_BOLD,
+    C.PINK: C.PINK_BOLD,
+    C.ORANGE: C.ORANGE_BOLD,
+    C.GRAY: C.GRAY_BOLD,
+}
+
+# Traits horizontaux précalculés une fois pour toutes : les bordures sont
+# redessinées à chaque frame, inutile de refaire '═' * n à chaque fois
+_H60 = '═' * 60
+
+# Frames du spinner préassemblées (retour chariot + couleur + glyphe +
+# reset) : la boucle d'animation n'a plus qu'à coller le texte derrière
+_SPINNER_FRAMES = tuple(f'\r{C.CYAN}{f}{C.RESET} ' for f in '⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏')
+# Version déjà encodée en UTF-8 pour écrire directement sur le fd du
+# terminal (os.write), sans repasser par le TextIOWrapper à chaque frame
+_SPINNER_BYTES = tuple(f.encode('utf-8') for f in _SPINNER_FRAMES)
+
+# Messages d'indice affichés à chaque tentative : les parties constantes
+# (couleurs et émojis compris) sont préassemblées ET pré-encodées en
+# UTF-8, il ne reste que le numéro de tentative à formater — l'affichage
+# est une écriture binaire brute, sans encodage str -> bytes
+_HINT_HIGH_PREFIX = f"{C.ORANGE}📉 Trop grand ! {C.GRAY}(Tentative #".encode('utf-8')
+_HINT_LOW_PREFIX = f"{C.BLUE}📈 Trop petit ! {C.GRAY}(Tentative #".encode('utf-8')
+_HINT_SUFFIX = f"){C.RESET}\n".encode('utf-8')
+
 # ============================================================================
 # FONCTIONS UTILITAIRES D'INTERFACE
 # ============================================================================
 
-def clear():
+_SGR_ADJACENT = re.compile(r'\x1b\[([0-9;]*)m\x1b\[([0-9;]*)m')
+
+def _compress_sgr(s: str) -> str:
+    """Fusionne les séquences SGR adjacentes en une seule
+
+    '\\033[0m\\033[1;38;5;221m' devient '\\033[0;1;38;5;221m' : même rendu
+    (les paramètres SGR s'appliquent dans l'ordre) mais moins d'octets à
+    envoyer et moins de travail pour l'automate du terminal.
+    """
+    prev = None
+    while prev != s:
+        prev = s
+        s = _SGR_ADJACENT.sub('\x1b[\\1;\\2m', s)
+    return s
+
+def _write_frame(s: str) -> None:
+    """Écrit une frame complète sur stdout en un seul write
+
+    Les séquences SGR sont compactées quand la sortie est un terminal ;
+    on ne réécrit pas le flux quand il est redirigé (pipe, fichier).
+    La frame est encodée une seule fois et écrite en bytes directement
+    sur le tampon binaire, sans repasser par le TextIOWrapper.
+    """
+    if sys.stdout.isatty():
+        s = _compress_sgr(s)
+    sys.stdout.flush()  # vider ce que print() a pu laisser en attente
+    try:
+        buffer = sys.stdout.buffer
+    except AttributeError:
+        # stdout remplacé (StringIO, tests...) : pas de tampon binaire
+        sys.stdout.write(s)
+        sys.stdout.flush()
+        return
+    buffer.write(s.encode('utf-8'))
+    buffer.flush()
+
+def _write_frame_bytes(b: bytes) -> None:
+    """Variante de _write_frame pour un rendu déjà encodé en UTF-8"""
+    sys.stdout.flush()
+    try:
+        buffer = sys.stdout.buffer
+    except AttributeError:
+        sys.stdout.write(b.decode('utf-8'))
+        sys.stdout.flush()
+        return
+    buffer.write(b)
+    buffer.flush()
+
+def clear() -> None:
     """Efface l'écran"""
     print('\033[2J\033[H', end='', flush=True)
 
-def banner():
+def banner() -> None:
     """Bannière ultra-moderne avec dégradé"""
-    clear()
-    print(f"""
-{C.PURPLE}{C.BOLD}
+    # Efface + dessine en un seul write : le terminal reçoit la trame
+    # complète d'un coup au lieu de deux écritures séparées
+    _write_frame(f"""\033[2J\033[H
+{C.PURPLE_BOLD}
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
     ║        {C.FIRE} JEU DE DEVINETTE v3.0 - CLIENT PYTHON {C.FIRE}        ║
@@ -84,65 +251,132 @@ def banner():
 {C.RESET}
 """)
 
-def box(title, content, color=C.CYAN):
-    """Boîte élégante avec bordures"""
+# Bordures de boîte entièrement statiques par couleur : construites au
+# premier usage puis resservies telles quelles à chaque frame
+_BOX_BORDERS = {}
+
+def _box_borders(color: str, bold: str) -> tuple:
+    cached = _BOX_BORDERS.get(color)
+    if cached is None:
+        cached = (
+            f"\n{bold}╔{_H60}╗{C.RESET}\n",
+            f"{bold}╠{_H60}╣{C.RESET}\n",
+            f"{bold}╚{_H60}╝{C.RESET}\n\n",
+        )
+        _BOX_BORDERS[color] = cached
+    return cached
+
+def box_str(title: str, lines: list, color: str = C.CYAN) -> str:
+    """Construire une boîte élégante (rendu retourné sous forme de str)"""
     width = 60
-    print(f"\n{color}{C.BOLD}╔{'═' * width}╗{C.RESET}")
-    print(f"{color}{C.BOLD}║{C.RESET} {title:^{width-2}} {color}{C.BOLD}║{C.RESET}")
-    print(f"{color}{C.BOLD}╠{'═' * width}╣{C.RESET}")
-    for line in content.split('\n'):
+    bold = _BOLD_OF.get(color, color + C.BOLD)
+    top, mid, bottom = _box_borders(color, bold)
+    parts = [
+        top,
+        f"{bold}║{C.RESET} {title:^{width-2}} {bold}║{C.RESET}\n",
+        mid,
+    ]
+    for line in lines:
         if line.strip():
-            print(f"{color}║{C.RESET} {line:<{width-2}} {color}║{C.RESET}")
-    print(f"{color}{C.BOLD}╚{'═' * width}╝{C.RESET}\n")
-
-def table(headers, rows, color=C.PURPLE):
-    """Tableau élégant"""
-    col_widths = [max(len(str(row[i])) for row in [headers] + rows) + 2 for i in range(len(headers))]
+            parts.append(f"{color}║{C.RESET} {line:<{width-2}} {color}║{C.RESET}\n")
+    parts.append(bottom)
+    return ''.join(parts)
+
+def box(title: str, lines: list, color: str = C.CYAN) -> None:
+    """Boîte élégante avec bordures (contenu : une liste de lignes)
+
+    Toute la boîte part en une seule écriture : un write(2) au lieu d'un
+    par ligne.
+    """
+    _write_frame(box_str(title, lines, color))
+
+def table_str(headers: list, rows: list, color: str = C.PURPLE) -> str:
+    """Construire un tableau élégant (rendu retourné sous forme de str)"""
+    # Un seul passage : on convertit chaque cellule en str une fois, puis
+    # on transpose avec zip(*) pour mesurer chaque colonne
+    str_rows = [[str(cell) for cell in row] for row in rows]
+    col_widths = [max(map(len, col)) + 2 for col in zip(headers, *str_rows)]
     total_width = sum(col_widths) + len(headers) + 1
+    bold = _BOLD_OF.get(color, color + C.BOLD)
 
-    print(f"\n{color}{C.BOLD}╔{'═' * total_width}╗{C.RESET}")
+    parts = [f"\n{bold}╔{'═' * total_width}╗{C.RESET}\n"]
 
     # En-têtes
-    header_line = f"{color}{C.BOLD}║{C.RESET}"
+    header_line = f"{bold}║{C.RESET}"
     for i, header in enumerate(headers):
-        header_line += f" {C.BOLD}{header:^{col_widths[i]-2}}{C.RESET} {color}{C.BOLD}│{C.RESET}" if i < len(headers) - 1 else f" {C.BOLD}{header:^{col_widths[i]-2}}{C.RESET} {color}{C.BOLD}║{C.RESET}"
-    print(header_line)
-
-    print(f"{color}{C.BOLD}╠{'═' * total_width}╣{C.RESET}")
-
-    # Lignes
-    for row in rows:
-        row_line = f"{color}║{C.RESET}"
-        for i, cell in enumerate(row):
-            cell_str = str(cell)
-            row_line += f" {cell_str:^{col_widths[i]-2}} {color}│{C.RESET}" if i < len(row) - 1 else f" {cell_str:^{col_widths[i]-2}} {color}║{C.RESET}"
-        print(row_line)
-
-    print(f"{color}{C.BOLD}╚{'═' * total_width}╝{C.RESET}\n")
-
-def spinner(text, duration=1.5):
-    """Animation de chargement moderne"""
-    frames = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
+        header_line += f" {C.BOLD}{header:^{col_widths[i]-2}}{C.RESET} {bold}│{C.RESET}" if i < len(headers) - 1 else f" {C.BOLD}{header:^{col_widths[i]-2}}{C.RESET} {bold}║{C.RESET}"
+    parts.append(header_line + '\n')
+
+    parts.append(f"{bold}╠{'═' * total_width}╣{C.RESET}\n")
+
+    # Lignes (les str des cellules sont déjà calculées) : les séparateurs
+    # colorés sont construits une fois puis assemblés par ''.join, au lieu
+    # de re-concaténer une grande f-string par ligne
+    row_start = f"{color}║{C.RESET}"
+    sep_mid = f" {color}│{C.RESET}"
+    sep_end = f" {color}║{C.RESET}"
+    last = len(headers) - 1
+    for row in str_rows:
+        segs = [row_start]
+        for i, cell_str in enumerate(row):
+            segs.append(f" {cell_str:^{col_widths[i]-2}}")
+            segs.append(sep_end if i == last else sep_mid)
+        segs.append('\n')
+        parts.append(''.join(segs))
+
+    parts.append(f"{bold}╚{'═' * total_width}╝{C.RESET}\n\n")
+
+    return ''.join(parts)
+
+def table(headers: list, rows: list, color: str = C.PURPLE) -> None:
+    """Tableau élégant (tout le tableau part en une seule écriture)"""
+    _write_frame(table_str(headers, rows, color))
+
+def spinner(text: str, done: Optional[threading.Event] = None, duration: float = 1.5) -> None:
+    """Animation de chargement moderne
+
+    Si `done` (threading.Event) est fourni, tourne jusqu'à ce qu'il soit
+    signalé — donc seulement le temps réel de l'opération ; sinon tourne
+    pendant `duration` secondes.
+    """
     end_time = time.time() + duration
     i = 0
-    while time.time() < end_time:
-        print(f'\r{C.CYAN}{frames[i % len(frames)]}{C.RESET} {text}', end='', flush=True)
-        time.sleep(0.08)
+
+    # Sur un vrai terminal, on écrit les frames pré-encodées directement
+    # sur le fd avec os.write : pas de TextIOWrapper, pas d'encodage, pas
+    # de verrou stdout à chaque frame
+    use_fd = sys.stdout.isatty()
+    if use_fd:
+        sys.stdout.flush()
+        fd = sys.stdout.fileno()
+        text_bytes = text.encode('utf-8')
+
+    while not (done.is_set() if done is not None else time.time() >= end_time):
+        if use_fd:
+            os.write(fd, _SPINNER_BYTES[i % 10] + text_bytes)
+        else:
+            sys.stdout.write(_SPINNER_FRAMES[i % 10] + text)
+            sys.stdout.flush()
+        if done is not None:
+            done.wait(0.08)
+        else:
+            time.sleep(0.08)
         i += 1
     print(f'\r{C.GREEN}{C.CHECK}{C.RESET} {text}')
 
-def celebrate():
+def celebrate() -> None:
     """Animation de victoire épique"""
-    print(f"\n{C.YELLOW}{C.BOLD}")
-    print("    ╔═══════════════════════════════════════════════╗")
-    print("    ║                                               ║")
-    print(f"    ║          {C.PARTY} VICTOIRE ÉPIQUE ! {C.PARTY}              ║")
-    print("    ║                                               ║")
-    print("    ╚═══════════════════════════════════════════════╝")
-    print(f"{C.RESET}\n")
-    time.sleep(1)
-
-def prompt(text):
+    _write_frame(
+        f"\n{C.YELLOW_BOLD}\n"
+        "    ╔═══════════════════════════════════════════════╗\n"
+        "    ║                                               ║\n"
+        f"    ║          {C.PARTY} VICTOIRE ÉPIQUE ! {C.PARTY}              ║\n"
+        "    ║                                               ║\n"
+        "    ╚═══════════════════════════════════════════════╝\n"
+        f"{C.RESET}\n\n"
+    )
+
+def prompt(text: str) -> str:
     """Prompt élégant"""
     return input(f"{C.PURPLE}{C.ARROW}{C.RESET} {text}").strip()
 
@@ -153,20 +387,96 @@ def prompt(text):
 class GameClient:
     """Client de jeu avec parsing JSON"""
 
-    def __init__(self, host: str, port: int):
+    # Stockage à emplacements fixes : accès attributs plus rapides dans
+    # les boucles chaudes et pas de __dict__ par instance
+    __slots__ = (
+        'host', 'port', 'socket', 'connected', 'player_name', '_name_bytes',
+        '_rxbuf', '_pending', '_lb_cache', '_outer_handlers', '_inner_handlers',
+    )
+
+    # Médailles du podium, indexées par rang - 1
+    _MEDALS = (C.MEDAL, '🥈', '🥉')
+
+    def __init__(self, host: str, port: int) -> None:
         self.host = host
         self.port = port
         self.socket: Optional[socket.socket] = None
         self.connected = False
         self.player_name = ""
+        self._name_bytes = b""  # nom + '\n' déjà encodé pour la reconnexion
+        self._rxbuf = bytearray()
+        self._pending = deque()  # frames complètes déjà reçues, pas encore lues
+        self._lb_cache = (None, None)  # (clé des scores, rendu ANSI)
+
+        # Tables de dispatch : un dict.get hashé remplace les chaînes de
+        # elif sur le type de message. Un handler qui retourne None laisse
+        # la boucle continuer ; un booléen termine la partie (rejouer ?)
+        self._outer_handlers = {
+            'stats': self.display_stats,
+            'leaderboard': self.display_leaderboard,
+            'prompt': self._on_prompt,
+            'name_accepted': self._on_name_accepted,
+            'game_start': self._on_game_start,
+            'error': self._on_error,
+        }
+        self._inner_handlers = {
+            'hint': self._on_hint,
+            'victory': self._on_victory,
+            'stats': self.display_stats,
+            'error': self._on_guess_error,
+            'bye': self._on_bye,
+        }
 
     def connect(self) -> bool:
         """Connexion au serveur"""
         try:
-            spinner(f"Connexion à {self.host}:{self.port}")
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # SO_REUSEADDR : pas de contention TIME_WAIT quand on relance
+            # le client coup sur coup
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            # TCP_NODELAY : désactive Nagle, sinon chaque petite commande
+            # (une ligne) peut attendre ~40ms avant de partir
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # TCP_QUICKACK (Linux) : acquitte tout de suite au lieu
+            # d'attendre le delayed-ACK ; on privilégie la latence, le
+            # débit n'est pas un enjeu pour quelques octets par tour
+            if hasattr(socket, 'TCP_QUICKACK'):
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            # Tampons noyau plus larges : une rafale stats+leaderboard est
+            # absorbée d'un coup sans bloquer la boucle de parsing
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 262144)
             self.socket.settimeout(CONNECTION_TIMEOUT)
-            self.socket.connect((self.host, self.port))
+
+            # Le connect() tourne dans un thread et le spinner ne s'anime
+            # que le temps réel du handshake (sur un LAN : < 1 ms), au lieu
+            # d'un délai fixe de 1.5 s
+            done = threading.Event()
+            error = []
+
+            def _do_connect():
+                try:
+                    self.socket.connect((self.host, self.port))
+                except Exception as e:
+                    error.append(e)
+                finally:
+                    done.set()
+
+            t = threading.Thread(target=_do_connect, daemon=True)
+            t.start()
+            spinner(f"Connexion à {self.host}:{self.port}", done)
+            t.join()
+
+            if error:
+                raise error[0]
+
+            # Socket bloquant : receive_json gère les délais avec select(),
+            # plus aucun settimeout sur le chemin chaud
+            self.socket.settimeout(None)
+            # Nouvelle connexion = nouveau flux : rien d'ancien à garder
+            self._rxbuf.clear()
+            self._pending.clear()
             self.connected = True
             print(f"{C.GREEN}{C.CHECK} Connecté avec succès !{C.RESET}\n")
             return True
@@ -177,170 +487,292 @@ class GameClient:
     def send(self, message: str) -> bool:
         """Envoyer un message"""
         try:
-            self.socket.sendall(f"{message}\n".encode('utf-8'))
+            # Concaténation bytes directe : pas de f-string intermédiaire
+            self.socket.sendall(message.encode('utf-8') + b'\n')
             return True
-        except:
+        except (OSError, AttributeError):
+            # OSError : socket fermé/cassé ; AttributeError : pas encore connecté
+            self.connected = False
             return False
 
-    def receive_json(self, timeout: float = 2.0) -> Optional[dict]:
-        """Recevoir et parser le JSON"""
-        try:
-            old_timeout = self.socket.gettimeout()
-            self.socket.settimeout(timeout)
-
-            data = self.socket.recv(BUFFER_SIZE)
-
-            self.socket.settimeout(old_timeout)
+    def receive_json(self, timeout: Optional[float] = None) -> Optional[dict]:
+        """Recevoir et parser le prochain message JSON (un par ligne)
 
-            if not data:
-                return None
+        TCP est un flux d'octets : deux messages peuvent arriver collés
+        dans un seul recv(), ou un message peut être coupé en deux. On
+        accumule donc dans un tampon et on découpe sur '\\n', comme le
+        serveur termine chaque message par '\\n'.
 
-            json_str = data.decode('utf-8').strip()
-            return json.loads(json_str)
-        except json.JSONDecodeError:
+        `timeout=None` applique le délai par défaut (RECEIVE_TIMEOUT).
+        L'attente est gérée par select() sur un socket bloquant : aucun
+        settimeout (donc aucun fcntl) sur le chemin chaud, et le timeout
+        qui expire ne coûte pas d'exception.
+        """
+        try:
+            # Un recv précédent a pu ramener plusieurs messages d'un coup :
+            # on sert d'abord ceux déjà en attente, sans nouveau syscall
+            if self._pending:
+                return _loads(self._pending.popleft())
+
+            if timeout is None:
+                timeout = RECEIVE_TIMEOUT
+            deadline = time.monotonic() + timeout
+
+            # Recherche incrémentale du '\n' : on ne rescanne jamais les
+            # octets déjà examinés, même si le message arrive en morceaux
+            scanned = 0
+            while self._rxbuf.find(b'\n', scanned) < 0:
+                scanned = len(self._rxbuf)
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                ready, _, _ = select.select([self.socket], [], [], remaining)
+                if not ready:
+                    return None
+                data = self.socket.recv(BUFFER_SIZE)
+                if not data:
+                    # recv vide = fin de connexion côté serveur (EOF normal,
+                    # pas besoin d'exception pour le détecter)
+                    self.connected = False
+                    return None
+                self._rxbuf.extend(data)
+
+            # Découpe toutes les frames complètes ; la première est rendue
+            # tout de suite, les suivantes sont mises en attente
+            *lines, rest = bytes(self._rxbuf).split(b'\n')
+            self._rxbuf = bytearray(rest)
+            self._pending.extend(lines[1:])
+
+            # orjson parse les bytes directement (pas de decode + strip)
+            return _loads(lines[0])
+        except (ValueError, TypeError):
+            # orjson.JSONDecodeError et json.JSONDecodeError héritent de ValueError
             return None
-        except:
+        except (OSError, socket.timeout):
+            self.connected = False
             return None
 
-    def display_stats(self, data: dict):
+    def _drain(self, idle: float = 0.05) -> None:
+        """Jeter tout ce que le serveur a déjà envoyé, sans le parser
+
+        Lit tant que des octets arrivent dans la fenêtre `idle` puis rend
+        la main : bien moins cher que des receive_json complets dont le
+        résultat est ignoré.
+        """
+        try:
+            while select.select([self.socket], [], [], idle)[0]:
+                if not self.socket.recv(BUFFER_SIZE):
+                    break
+        except OSError:
+            pass
+        self._rxbuf.clear()
+        self._pending.clear()
+
+    def display_stats(self, data: dict) -> None:
         """Afficher les stats du serveur de manière élégante"""
+        # Un seul accès dict par champ, le reste travaille sur des locaux
+        uptime = data['uptime']
+        active = data['active_clients']
+        served = data['total_served']
+        games = data['total_games']
+        best = data['best_attempts']
+        avg = data['avg_attempts']
         box(
             f"{C.CYAN}📊 STATISTIQUES DU SERVEUR{C.RESET}",
-            f"⏱️  Uptime              : {data['uptime']}s\n"
-            f"👥 Clients actifs      : {data['active_clients']}\n"
-            f"📈 Total servi         : {data['total_served']}\n"
-            f"🎮 Parties jouées      : {data['total_games']}\n"
-            f"🏆 Meilleur (tentatives): {data['best_attempts']}\n"
-            f"📊 Moyenne tentatives  : {data['avg_attempts']:.1f}",
+            [
+                f"⏱️  Uptime              : {uptime}s",
+                f"👥 Clients actifs      : {active}",
+                f"📈 Total servi         : {served}",
+                f"🎮 Parties jouées      : {games}",
+                f"🏆 Meilleur (tentatives): {best}",
+                f"📊 Moyenne tentatives  : {avg:.1f}",
+            ],
             C.CYAN
         )
 
-    def display_leaderboard(self, data: dict):
+    def display_leaderboard(self, data: dict) -> None:
         """Afficher le leaderboard avec un beau tableau"""
-        if data['count'] == 0:
+        count = data['count']
+        if count == 0:
             print(f"{C.GRAY}Aucun score enregistré{C.RESET}\n")
             return
 
-        print(f"\n{C.YELLOW}{C.BOLD}{C.TROPHY} TOP {data['count']} MEILLEURS SCORES {C.TROPHY}{C.RESET}\n")
+        # Le leaderboard change rarement entre deux affichages : on garde
+        # le dernier rendu et on le réécrit tel quel si les scores sont
+        # identiques
+        key = tuple((s['rank'], s['name'], s['score'], s['attempts'], s['duration'])
+                    for s in data['scores'])
+        if key == self._lb_cache[0]:
+            # Rendu déjà encodé en bytes : une seule écriture binaire
+            _write_frame_bytes(self._lb_cache[1])
+            return
 
         headers = ['🏅 Rang', 'Joueur', 'Score', 'Essais', 'Temps']
         rows = []
 
         for score in data['scores']:
-            medal = C.MEDAL if score['rank'] == 1 else '🥈' if score['rank'] == 2 else '🥉' if score['rank'] == 3 else f"#{score['rank']}"
+            # Chaque champ n'est cherché qu'une fois dans le dict
+            rank = score['rank']
+            name = score['name']
+            points = score['score']
+            attempts = score['attempts']
+            duration = score['duration']
+            medal = self._MEDALS[rank - 1] if rank < 4 else f"#{rank}"
             rows.append([
                 medal,
-                score['name'],
-                f"{score['score']} pts",
-                score['attempts'],
-                f"{score['duration']}s"
+                name,
+                f"{points} pts",
+                attempts,
+                f"{duration}s"
             ])
 
-        table(headers, rows, C.YELLOW)
+        rendered = (
+            f"\n{C.YELLOW_BOLD}{C.TROPHY} TOP {count} MEILLEURS SCORES {C.TROPHY}{C.RESET}\n"
+            + table_str(headers, rows, C.YELLOW)
+        )
+        if sys.stdout.isatty():
+            rendered = _compress_sgr(rendered)
+        encoded = rendered.encode('utf-8')
+        self._lb_cache = (key, encoded)
+        _write_frame_bytes(encoded)
+
+    # ------------------------------------------------------------------
+    # Handlers de messages (voir les tables de dispatch dans __init__)
+    # ------------------------------------------------------------------
+
+    def _on_prompt(self, data: dict) -> None:
+        """PROMPT : le serveur demande le nom"""
+        print(f"{C.PURPLE}{data['message']}{C.RESET}")
+        name = prompt("")
+        self.send(name)
+
+    def _on_name_accepted(self, data: dict) -> None:
+        """NOM ACCEPTÉ"""
+        self.player_name = data['name']
+        self._name_bytes = self.player_name.encode('utf-8') + b'\n'
+        print(f"{C.GREEN}{C.CHECK} Bienvenue {C.BOLD}{self.player_name}{C.RESET}{C.GREEN} !{C.RESET}\n")
+
+    def _on_error(self, data: dict) -> bool:
+        """ERREUR fatale : termine la partie"""
+        print(f"{C.RED}{C.CROSS} {data['message']}{C.RESET}")
+        return False
+
+    def _on_guess_error(self, response: dict) -> None:
+        """ERREUR sur une tentative (entrée invalide) : on continue"""
+        print(f"{C.RED}{C.CROSS} {response['message']}{C.RESET}")
+
+    def _on_hint(self, response: dict) -> None:
+        """INDICE trop grand / trop petit"""
+        direction = response['direction']
+        attempts = response['attempts']
+
+        prefix = _HINT_HIGH_PREFIX if direction == 'grand' else _HINT_LOW_PREFIX
+        _write_frame_bytes(prefix + b'%d' % attempts + _HINT_SUFFIX)
+
+    def _on_victory(self, response: dict) -> bool:
+        """VICTOIRE !"""
+        celebrate()
 
-    def play_game(self) -> bool:
+        box(
+            f"{C.PARTY} FÉLICITATIONS {C.PARTY}",
+            [
+                f"Joueur    : {C.BOLD}{response['player']}{C.RESET}",
+                f"Nombre    : {response['number']}",
+                f"Tentatives: {response['attempts']}",
+                f"Temps     : {response['duration']}s",
+                f"Score     : {C.YELLOW_BOLD}{response['score']} points{C.RESET}",
+            ],
+            C.GREEN
+        )
+
+        # Attendre le nouveau leaderboard (receive_json bloque déjà
+        # jusqu'à son arrivée, ou le sert depuis la file s'il est arrivé
+        # collé au message victory)
+        lb_data = self.receive_json(timeout=3.0)
+        if lb_data and lb_data.get('type') == 'leaderboard':
+            self.display_leaderboard(lb_data)
+
+        return self.ask_retry()
+
+    def _on_bye(self, response: dict) -> bool:
+        """BYE : le serveur met fin à la session"""
+        print(f"{C.YELLOW}👋 {response['message']}{C.RESET}")
+        return False
+
+    def _on_game_start(self, data: dict) -> Optional[bool]:
+        """DÉBUT DE PARTIE : boucle de tentatives"""
+        box(
+            f"{C.GAME} DÉBUT DE LA PARTIE",
+            [
+                f"Joueur : {C.BOLD}{data['player']}{C.RESET}",
+                f"Plage  : {data['min']} - {data['max']}",
+                f"{C.CYAN}💡 Commandes: stats | quit{C.RESET}",
+            ],
+            C.PURPLE
+        )
+
+        # Le prompt est rendu une seule fois pour toute la partie, et on
+        # lit stdin directement : pas de réassemblage ANSI ni de passage
+        # par le module readline de input() à chaque tentative
+        guess_prompt = f"{C.PURPLE}{C.ARROW}{C.RESET} Votre nombre "
+
+        # Méthodes liées hissées en locales : un LOAD_FAST par tentative
+        # au lieu de deux résolutions d'attributs
+        send = self.send
+        recv = self.receive_json
+        handlers = self._inner_handlers
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        readline = sys.stdin.readline
+
+        while True:
+            write(guess_prompt)
+            flush()
+            guess = readline()
+            if not guess:
+                # EOF sur stdin : on rend la main comme sur une déconnexion
+                return None
+            guess = guess.strip()
+            if not guess:
+                continue
+
+            send(guess)
+            response = recv()
+
+            if not response:
+                # connexion perdue : on rend la main à play_game
+                return None
+
+            handler = handlers.get(response.get('type'))
+            if handler is None:
+                continue
+            result = handler(response)
+            if result is not None:
+                return result
+
+    def play_game(self) -> Optional[bool]:
         """Boucle de jeu principale"""
+        recv = self.receive_json
+        handlers = self._outer_handlers
+
         while self.connected:
-            data = self.receive_json()
+            data = recv()
 
             if not data:
                 print(f"{C.RED}{C.CROSS} Connexion perdue{C.RESET}")
                 return False
 
-            msg_type = data.get('type')
-
-            # STATS
-            if msg_type == 'stats':
-                self.display_stats(data)
-
-            # LEADERBOARD
-            elif msg_type == 'leaderboard':
-                self.display_leaderboard(data)
-
-            # PROMPT (demande de nom)
-            elif msg_type == 'prompt':
-                print(f"{C.PURPLE}{data['message']}{C.RESET}")
-                name = prompt("")
-                self.send(name)
-
-            # NOM ACCEPTÉ
-            elif msg_type == 'name_accepted':
-                self.player_name = data['name']
-                print(f"{C.GREEN}{C.CHECK} Bienvenue {C.BOLD}{self.player_name}{C.RESET}{C.GREEN} !{C.RESET}\n")
-
-            # DÉBUT DE PARTIE
-            elif msg_type == 'game_start':
-                box(
-                    f"{C.GAME} DÉBUT DE LA PARTIE",
-                    f"Joueur : {C.BOLD}{data['player']}{C.RESET}\n"
-                    f"Plage  : {data['min']} - {data['max']}\n\n"
-                    f"{C.CYAN}💡 Commandes: stats | quit{C.RESET}",
-                    C.PURPLE
-                )
-
-                # Boucle de tentatives
-                while True:
-                    guess = prompt("Votre nombre ")
-                    if not guess:
-                        continue
-
-                    self.send(guess)
-                    response = self.receive_json()
-
-                    if not response:
-                        break
-
-                    resp_type = response.get('type')
-
-                    # INDICE
-                    if resp_type == 'hint':
-                        direction = response['direction']
-                        attempts = response['attempts']
-
-                        if direction == 'grand':
-                            print(f"{C.ORANGE}📉 Trop grand ! {C.GRAY}(Tentative #{attempts}){C.RESET}")
-                        else:
-                            print(f"{C.BLUE}📈 Trop petit ! {C.GRAY}(Tentative #{attempts}){C.RESET}")
-
-                    # VICTOIRE !
-                    elif resp_type == 'victory':
-                        celebrate()
-
-                        box(
-                            f"{C.PARTY} FÉLICITATIONS {C.PARTY}",
-                            f"Joueur    : {C.BOLD}{response['player']}{C.RESET}\n"
-                            f"Nombre    : {response['number']}\n"
-                            f"Tentatives: {response['attempts']}\n"
-                            f"Temps     : {response['duration']}s\n"
-                            f"Score     : {C.YELLOW}{C.BOLD}{response['score']} points{C.RESET}",
-                            C.GREEN
-                        )
-
-                        # Attendre le nouveau leaderboard
-                        time.sleep(0.5)
-                        lb_data = self.receive_json(timeout=3.0)
-                        if lb_data and lb_data.get('type') == 'leaderboard':
-                            self.display_leaderboard(lb_data)
-
-                        return self.ask_retry()
-
-                    # STATS
-                    elif resp_type == 'stats':
-                        self.display_stats(response)
-
-                    # ERREUR
-                    elif resp_type == 'error':
-                        print(f"{C.RED}{C.CROSS} {response['message']}{C.RESET}")
-
-                    # BYE
-                    elif resp_type == 'bye':
-                        print(f"{C.YELLOW}👋 {response['message']}{C.RESET}")
-                        return False
-
-            # ERREUR
-            elif msg_type == 'error':
-                print(f"{C.RED}{C.CROSS} {data['message']}{C.RESET}")
-                return False
+            handler = handlers.get(data.get('type'))
+            if handler is None:
+                continue
+            result = handler(data)
+            if result is not None:
+                return result
+
+        # Connexion tombée pendant un handler (EOF repéré par send/
+        # receive_json) : même message que la branche `not data`
+        print(f"{C.RED}{C.CROSS} Connexion perdue{C.RESET}")
+        return False
 
     def ask_retry(self) -> bool:
         """Demander si rejouer"""
@@ -348,12 +780,14 @@ class GameClient:
         choice = prompt("").lower()
         return choice in ['o', 'oui', 'y', 'yes']
 
-    def run(self):
+    def run(self) -> None:
         """Exécution principale"""
         box(
             f"{C.ROCKET} BIENVENUE",
-            f"Score = 10000 - (essais × 100) - temps\n"
-            f"Plage: 0-100 | Nom: 3-10 lettres (a-z)",
+            [
+                "Score = 10000 - (essais × 100) - temps",
+                "Plage: 0-100 | Nom: 3-10 lettres (a-z)",
+            ],
             C.PURPLE
         )
 
@@ -365,27 +799,39 @@ class GameClient:
             if not retry:
                 break
 
-            # Reconnexion
+            # Reconnexion immédiate puis backoff progressif : sur un LAN
+            # le serveur réaccepte en quelques millisecondes, pas besoin
+            # d'attendre une seconde fixe
             print(f"\n{C.CYAN}Reconnexion...{C.RESET}\n")
             self.disconnect()
-            time.sleep(1)
 
-            if not self.connect():
+            for delay in (0, 0.01, 0.04, 0.16, 0.5):
+                if delay:
+                    time.sleep(delay)
+                if self.connect():
+                    break
+            if not self.connected:
                 break
 
-            # Attendre stats et leaderboard
-            self.receive_json(timeout=2.0)
-            self.receive_json(timeout=2.0)
+            # Jeter les stats et le leaderboard d'accueil sans les parser
+            self._drain()
 
-            # Envoyer le nom automatiquement
-            self.send(self.player_name)
+            # Envoyer le nom automatiquement (payload déjà encodé lors de
+            # l'acceptation du nom)
+            if self._name_bytes:
+                try:
+                    self.socket.sendall(self._name_bytes)
+                except OSError:
+                    break
+            else:
+                self.send(self.player_name)
 
-    def disconnect(self):
+    def disconnect(self) -> None:
         """Déconnexion propre"""
         if self.socket:
             try:
                 self.socket.close()
-            except:
+            except OSError:
                 pass
         self.connected = False
 
@@ -393,11 +839,11 @@ class GameClient:
 # PROGRAMME PRINCIPAL
 # ============================================================================
 
-def signal_handler(signum, frame):
+def signal_handler(signum, frame) -> None:
     print(f"\n{C.YELLOW}Interruption{C.RESET}")
     sys.exit(0)
 
-def main():
+def main() -> None:
     signal.signal(signal.SIGINT, signal_handler)
 
     banner()
@@ -418,7 +864,7 @@ def main():
         print(f"{C.RED}{C.CROSS} Erreur: {e}{C.RESET}")
     finally:
         client.disconnect()
-        print(f"\n{C.PURPLE}{C.BOLD}Merci d'avoir joué ! À bientôt {C.FIRE}{C.RESET}\n")
+        print(f"\n{C.PURPLE_BOLD}Merci d'avoir joué ! À bientôt {C.FIRE}{C.RESET}\n")
 
 if __name__ == "__main__":
     main()